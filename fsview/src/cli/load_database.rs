@@ -53,7 +53,7 @@ impl Command {
     pub fn execute(&self, session: &Session) -> Result<()> {
         let elapsed = StopWatch::start_new();
         session.add_folder(&self.args.folder_path)?;
-        println!("overall={elapsed}");
+        log::info!("load took {elapsed}");
         Ok(())
     }
 }
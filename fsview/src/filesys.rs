@@ -254,9 +254,11 @@ pub fn collect_metadata(folder_path: &PathBuf) -> Result<FsMetadata> {
         } else {
             std::fs::canonicalize(folder_path.clone())?
         };
-        let collect_time = StopWatch::start_new();
+        let collect_time = if log::log_enabled!(log::Level::Debug) { Some(StopWatch::start_new()) } else { None };
         let folder = visit_folder(&folder_path)?;
-        log::debug!("collect_metadata={collect_time}");
+        if let Some(collect_time) = collect_time {
+            log::debug!("collect_metadata={collect_time}");
+        }
         if log::log_enabled!(log::Level::Trace) {
             dump_metadata(&folder);
         }
@@ -41,7 +41,7 @@ impl From<&str> for Error {
 
 impl From<lib::Error> for Error {
     fn from(error: lib::Error) -> Self {
-        Error(String::from(&error))
+        Error(String::from(error))
     }
 }
 
@@ -72,15 +72,15 @@ pub struct CommandArgs {
     ///
     /// The form of the date can be YYYY-MM-DD, MM-DD-YYYY, or MMM-DD-YYYY
     /// where MMM is Jan, Feb, etc.
-    #[clap(forbid_empty_values = true, validator = validate_date_string)]
-    start: String,
+    #[clap(forbid_empty_values = true, value_parser = parse_date_arg)]
+    start: Date<Utc>,
     /// The ending date for the report
     ///
     /// The form of the date can be YYYY-MM-DD, MM-DD-YYYY, or MMM-DD-YYYY
     /// where MMM is Jan, Feb, etc. If the argument is not given history will
     /// be generated for the start date only.
-    #[clap(forbid_empty_values = true, validator = validate_date_string)]
-    ends: Option<String>,
+    #[clap(forbid_empty_values = true, value_parser = parse_date_arg)]
+    ends: Option<Date<Utc>>,
 }
 
 /// The implementation for report history command flags.
@@ -128,12 +128,9 @@ impl ReportHistory {
     /// `weather_data` - the `domain` instance that will be used.
     ///
     fn get_daily_histories(&self, weather_data: &WeatherData) -> CliResult<LocationDailyHistories> {
-        let lower = parse_date(&self.args.start)?;
-        let upper = if let Some(ends) = &self.args.ends {
-            parse_date(&ends)?
-        } else {
-            lower.clone()
-        };
+        // the dates were parsed when the command line was parsed
+        let lower = self.args.start;
+        let upper = self.args.ends.unwrap_or(lower);
         let query = LocationQuery {
             location_filter: vec![self.args.location.clone()],
             sort: false,
@@ -215,18 +212,19 @@ fn validate_location(location: &str) -> result::Result<(), String> {
     }
 }
 
-/// Used by the parser to validate the date strings that were entered.
+/// Used by the parser to convert the date strings that were entered.
 ///
-/// Check the [parse date](parse_date) function to see what date string are acceptable.
+/// Check the [parse date](parse_date) function to see what date string are acceptable. The
+/// parsed date is kept in the command arguments so it does not need to be parsed again.
 ///
 /// # Arguments
 ///
-/// * `date_str` - the date string that will be validated.
+/// * `date_str` - the date string that will be converted.
 ///
-/// An error will be returned if there are errors validating the date.
-fn validate_date_string(date_str: &str) -> Result<(), String> {
+/// An error will be returned if there are errors parsing the date.
+fn parse_date_arg(date_str: &str) -> Result<Date<Utc>, String> {
     match parse_date(&date_str) {
-        Ok(_) => Ok(()),
+        Ok(date) => Ok(date),
         Err(error) => Err(format!("{error}")),
     }
 }
@@ -248,7 +246,13 @@ fn validate_date_string(date_str: &str) -> Result<(), String> {
 ///
 /// An error will be returned if the date parsing fails.
 fn parse_date(date_str: &str) -> CliResult<Date<Utc>> {
-    for fmt in ["%Y-%m-%d", "%m-%d-%Y", "%b-%d-%Y"] {
+    // only the month name form starts with a letter so don't try formats that cannot match
+    let fmts: &[&str] = if date_str.starts_with(|c: char| c.is_ascii_alphabetic()) {
+        &["%b-%d-%Y"]
+    } else {
+        &["%Y-%m-%d", "%m-%d-%Y"]
+    };
+    for fmt in fmts {
         if let Ok(naive_date) = NaiveDate::parse_from_str(date_str, fmt) {
             return Ok(Date::<Utc>::from_utc(naive_date, Utc));
         }
@@ -270,7 +274,7 @@ mod tests {
                 sum,
                 all,
                 location: "".to_string(),
-                start: "".to_string(),
+                start: Utc.ymd(2022, 7, 15),
                 ends: None,
             }
         };
@@ -308,14 +312,14 @@ mod tests {
 
     #[test]
     fn validate_dates() {
-        assert!(validate_date_string("2022-7-15").is_ok());
-        assert!(validate_date_string("7-1-2022").is_ok());
-        assert!(validate_date_string("7-1-22").is_ok());
-        assert!(validate_date_string("jul-15-2022").is_ok());
-        assert!(validate_date_string("Jul-15-2022").is_ok());
-        assert!(validate_date_string("JUL-15-2022").is_ok());
-        assert!(validate_date_string("JUL-15-22").is_ok());
-        assert!(validate_date_string("JULY-15-22").is_err());
+        assert!(parse_date_arg("2022-7-15").is_ok());
+        assert!(parse_date_arg("7-1-2022").is_ok());
+        assert!(parse_date_arg("7-1-22").is_ok());
+        assert!(parse_date_arg("jul-15-2022").is_ok());
+        assert!(parse_date_arg("Jul-15-2022").is_ok());
+        assert!(parse_date_arg("JUL-15-2022").is_ok());
+        assert!(parse_date_arg("JUL-15-22").is_ok());
+        assert!(parse_date_arg("JULY-15-22").is_err());
     }
 
     #[test]
@@ -977,6 +981,16 @@ mod csv {
 
     use super::{CliResult, CommandArgs, DateTime, LocationDailyHistories, SecondsFormat};
 
+    /// The CSV labels of the temperature (`temp`) columns.
+    const TEMP_LABELS: [&str; 4] = ["temperatureHigh", "temperatureHighTime", "temperatureLow", "temperatureLowTime"];
+    /// The CSV labels of the min/max temperature (`max`) columns.
+    const MAX_LABELS: [&str; 4] = ["temperatureMax", "temperatureMaxTime", "temperatureMin", "temperatureMinTime"];
+    /// The CSV labels of the conditions (`cnd`) columns.
+    const CND_LABELS: [&str; 7] =
+        ["windSpeed", "windGust", "windGustTime", "windBearing", "cloudCover", "uvIndex", "uvIndexTime"];
+    /// The CSV labels of the summary (`sum`) columns.
+    const SUM_LABELS: [&str; 6] = ["sunrise", "sunset", "moonPhase", "humidity", "dewPoint", "summary"];
+
     /// Generates the list history CSV based report.
     ///
     /// An error will be returned if there are issues writing the report.
@@ -995,39 +1009,24 @@ mod csv {
         let mut writer = Writer::from_writer(report_writer.create()?);
         let mut labels: Vec<&str> = vec!["date"];
         if report_args.is_temp() {
-            labels.push("temperatureHigh");
-            labels.push("temperatureHighTime");
-            labels.push("temperatureLow");
-            labels.push("temperatureLowTime");
+            labels.extend_from_slice(&TEMP_LABELS);
         }
         if report_args.is_max() {
-            labels.push("temperatureMax");
-            labels.push("temperatureMaxTime");
-            labels.push("temperatureMin");
-            labels.push("temperatureMinTime");
+            labels.extend_from_slice(&MAX_LABELS);
         }
         if report_args.is_cnd() {
-            labels.push("windSpeed");
-            labels.push("windGust");
-            labels.push("windGustTime");
-            labels.push("windBearing");
-            labels.push("cloudCover");
-            labels.push("uvIndex");
-            labels.push("uvIndexTime");
+            labels.extend_from_slice(&CND_LABELS);
         }
         if report_args.is_sum() {
-            labels.push("sunrise");
-            labels.push("sunset");
-            labels.push("moonPhase");
-            labels.push("humidity");
-            labels.push("dewPoint");
-            labels.push("summary");
+            labels.extend_from_slice(&SUM_LABELS);
         }
         writer.write_record(&labels)?;
         if let Some((location, daily_histories)) = location_daily_histories {
             let tz: Tz = location.tz.parse().unwrap();
             for daily_history in daily_histories.daily_histories {
-                let mut history = vec![fmt_isodate(&daily_history.date)];
+                // every row has a value for each label so size it once
+                let mut history = Vec::with_capacity(labels.len());
+                history.push(fmt_isodate(&daily_history.date));
                 if report_args.is_temp() {
                     history.push(float_value(&daily_history.temperature_high));
                     history.push(datetime_value(&daily_history.temperature_high_time, &tz));
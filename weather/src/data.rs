@@ -18,21 +18,12 @@ use std::{
 
 use chrono::prelude::*;
 
-// use crate::core;
-// use super::{domain, Error, Result};
 use super::domain;
-// use super::domain::{DailyHistories, HistoryDates, HistorySummary, Locations};
-
-/// The module containing the filesystem implementation.
-// mod fs;
 
 mod objects;
 mod files;
 
-pub use objects::DailyHistoryQuery;
-pub use objects::HistoryQuery;
-pub use objects::LocationQuery;
-pub use objects::HistoryBounds;
+pub use objects::{DailyHistoryQuery, HistoryBounds, HistoryQuery, LocationQuery};
 
 /// The Result returned from the data module.
 pub type Result<T> = result::Result<T, Error>;
@@ -53,6 +44,12 @@ impl From<&Error> for String {
     }
 }
 
+impl From<Error> for String {
+    fn from(error: Error) -> Self {
+        error.0
+    }
+}
+
 impl From<String> for Error {
     fn from(error: String) -> Self {
         Error::from(error.as_str())
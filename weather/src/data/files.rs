@@ -156,19 +156,6 @@ impl DataAPI for FsData {
     /// * `location_query` - identifies the locations and how data should be returned.
     ///
     fn get_location_data(&self, location_query: LocationQuery) -> Result<Locations> {
-        let include_location = |name: &String, alias: &String| -> bool {
-            if location_query.filters.is_empty() {
-                true
-            } else {
-                let name_pat = if location_query.case_insensitive { name.to_lowercase() } else { name.clone() };
-                let alias_pat = if location_query.case_insensitive { alias.to_lowercase() } else { alias.clone() };
-                location_query.filters
-                    .iter()
-                    .find(|p| name_pat.starts_with(*p) || alias_pat.starts_with(*p))
-                    .is_some()
-            }
-        };
-
         let locations_path = self.data_dir.join("locations.json");
         let root = value_from_path(locations_path)?;
         if !root.is_object() {
@@ -181,13 +168,14 @@ impl DataAPI for FsData {
                 let mut locations: Locations = vec![];
                 if let Value::Array(locations_array) = locations_value.unwrap() {
                     for location_value in locations_array {
-                        let name = value_as_string(location_value.get("name"));
-                        let alias = value_as_string(location_value.get("alias"));
-                        if include_location(&name, &alias) {
+                        // only build the location after it is known to be included
+                        let name = str_from_value(location_value.get("name"));
+                        let alias = str_from_value(location_value.get("alias"));
+                        if include_location(&location_query.filters, location_query.case_insensitive, name, alias) {
                             locations.push(Location {
-                                id: alias.clone(),
-                                name,
-                                alias,
+                                id: alias.to_string(),
+                                name: name.to_string(),
+                                alias: alias.to_string(),
                                 longitude: value_as_string(location_value.get("longitude")),
                                 latitude: value_as_string(location_value.get("latitude")),
                                 tz: value_as_string(location_value.get("tz")),
@@ -204,6 +192,42 @@ impl DataAPI for FsData {
     }
 }
 
+/// Returns `true` if a location name or alias starts with one of the filters.
+///
+/// All locations are included if there are no filters. When the match is case insensitive both
+/// the filters and location are compared in lowercase.
+///
+/// # Arguments
+///
+/// * `filters` - the location filters.
+/// * `case_insensitive` - if `true` case will be ignored.
+/// * `name` - the location name.
+/// * `alias` - the location alias.
+///
+fn include_location(filters: &[String], case_insensitive: bool, name: &str, alias: &str) -> bool {
+    if filters.is_empty() {
+        true
+    } else if case_insensitive {
+        filters.iter().any(|f| starts_with_ignore_case(name, f) || starts_with_ignore_case(alias, f))
+    } else {
+        filters.iter().any(|f| name.starts_with(f.as_str()) || alias.starts_with(f.as_str()))
+    }
+}
+
+/// Returns `true` if the text starts with the prefix ignoring case.
+///
+/// The characters are lowercased as they are compared so neither string is copied.
+///
+/// # Arguments
+///
+/// * `text` - the text that will be checked.
+/// * `prefix` - the leading text to look for.
+///
+fn starts_with_ignore_case(text: &str, prefix: &str) -> bool {
+    let mut text_chars = text.chars().flat_map(char::to_lowercase);
+    prefix.chars().flat_map(char::to_lowercase).all(|c| text_chars.next() == Some(c))
+}
+
 /// Returns daily history mined from the JSON document.
 ///
 /// `None` will be returned if the daily history node cannot be found in the document.
@@ -311,6 +335,17 @@ pub fn string_from_value(value: Option<&Value>) -> Option<String> {
         v.as_str().map_or(None, |s| Some(s.to_string())))
 }
 
+/// Returns a borrowed string if the value is not `None`, an empty string otherwise.
+///
+/// # Arguments
+///
+/// * `value` - the value that will be borrowed as a string.
+///
+#[inline]
+pub fn str_from_value(value: Option<&Value>) -> &str {
+    value.map_or(None, |v| v.as_str()).unwrap_or("")
+}
+
 /// Returns a string if the value is not `None`, an empty string otherwise.
 ///
 /// # Arguments
@@ -481,6 +516,23 @@ mod tests {
         let bad_string = json!(123);
         assert_eq!(string_from_value(Some(&bad_string)), None);
         assert_eq!(value_as_string(Some(&bad_string)), "".to_string());
+        assert_eq!(str_from_value(Some(&string)), "123");
+        assert_eq!(str_from_value(Some(&bad_string)), "");
+        assert_eq!(str_from_value(None), "");
+    }
+
+    #[test]
+    fn location_filters() {
+        let name = "Las Vegas, NV";
+        let alias = "vegas";
+        assert!(include_location(&[], false, name, alias));
+        assert!(include_location(&["Las".to_string()], true, name, alias));
+        assert!(include_location(&["las".to_string()], true, name, alias));
+        assert!(include_location(&["VEG".to_string()], true, name, alias));
+        assert!(!include_location(&["las".to_string()], false, name, alias));
+        assert!(include_location(&["Las".to_string()], false, name, alias));
+        assert!(!include_location(&["Reno".to_string()], true, name, alias));
+        assert!(!include_location(&["las vegas, nv, usa".to_string()], true, name, alias));
     }
 
     #[test]
@@ -580,8 +632,9 @@ mod archive {
                 Err(Error::from("The format of the name is incorrect..."))
             } else {
                 let ymd_index = name.len() - ymd_offset;
-                let ymd: &str = &name[ymd_index..ymd_index + 8];
-                if !ymd.chars().all(char::is_numeric) {
+                // a byte scan is enough, only ASCII digits can be parsed below
+                let ymd: &str = name.get(ymd_index..ymd_index + 8).unwrap_or("");
+                if ymd.is_empty() || !ymd.bytes().all(|b| b.is_ascii_digit()) {
                     Err(Error::from("The name date was not all digits..."))
                 } else {
                     let y = ymd[..4].parse().unwrap();
@@ -611,6 +664,9 @@ mod archive {
             assert!(date_from_name("000000dd.json").is_err());
             assert!(date_from_name("20220732.json").is_err());
             assert!(date_from_name("20221731.json").is_err());
+            assert!(date_from_name("\u{0662}\u{0660}\u{0662}\u{0662}\u{0660}\u{0667}\u{0660}\u{0661}.json").is_err());
+            // the date offset falls inside the multibyte character
+            assert!(date_from_name("\u{00e9}1234567.json").is_err());
         }
 
         #[test]
@@ -12,16 +12,10 @@
 //!
 mod objects;
 
-pub use objects::DailyHistories;
-pub use objects::DailyHistory;
-pub use objects::DailyHistoryQuery;
-pub use objects::HistoryDates;
-pub use objects::HistoryRange;
-pub use objects::HistorySummary;
-pub use objects::Location;
-pub use objects::LocationQuery;
-
-// use crate::core;
+pub use objects::{
+    DailyHistories, DailyHistory, DailyHistoryQuery, HistoryDates, HistoryRange, HistorySummary, Location, LocationQuery,
+};
+
 use super::data;
 
 use std::{fmt, io, result};
@@ -56,7 +50,7 @@ impl From<io::Error> for Error {
 
 impl From<data::Error> for Error {
     fn from(error: data::Error) -> Self {
-        Error(String::from(&error))
+        Error(String::from(error))
     }
 }
 
@@ -66,19 +60,11 @@ impl From<&Error> for String {
     }
 }
 
-
-/// The result of calling the domain API.
-///
-/// Currently it's an alias to the core result type but in the future
-/// it could change.
-// type DomainResult<T> = super::Result<T>;
-
-/// An error that can be returned from the domain api.
-///
-/// Currently it's an alias to the core error but in the future
-/// it could change.
-// #[allow(dead_code)]
-// type DomainError = super::Error;
+impl From<Error> for String {
+    fn from(error: Error) -> Self {
+        error.0
+    }
+}
 
 /// The daily histories for a location.
 ///